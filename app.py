@@ -1,10 +1,19 @@
-from datetime import datetime, timedelta
-from collections import Counter
+from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
+import math
+import textwrap
+import time
 import streamlit as st
 import requests
+import orjson
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import plotly.graph_objects as go
 import pandas as pd
+import numpy as np
 import os
+from urllib.parse import parse_qs, urlparse
+import repo_cache
 import snapshot_utils
 
 
@@ -27,16 +36,336 @@ st.set_page_config(layout="wide")
 
 # Import after set_page_config: avoid init-order issues on Streamlit Cloud. Module is named
 # keyword_analysis (not "analysis") to avoid clashing with Streamlit's script registry.
-from keyword_analysis import display_analysis
+from keyword_analysis import build_keyword_frame, display_analysis, repos_fingerprint
 
 # GitHub API endpoint for searching repositories
 GITHUB_API_URL = "https://api.github.com/search/repositories"
 
+# GraphQL endpoint, used instead of REST search when a token is available
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+
+# Selects only the repository fields the dashboard displays
+GRAPHQL_SEARCH_QUERY = """
+query($q: String!, $first: Int!, $after: String) {
+  search(query: $q, type: REPOSITORY, first: $first, after: $after) {
+    repositoryCount
+    pageInfo { endCursor hasNextPage }
+    nodes {
+      ... on Repository {
+        databaseId
+        name
+        stargazerCount
+        pushedAt
+        createdAt
+        url
+        forkCount
+        issues(states: OPEN) { totalCount }
+        pullRequests(states: OPEN) { totalCount }
+        primaryLanguage { name }
+        licenseInfo { name }
+        description
+        repositoryTopics(first: 20) { nodes { topic { name } } }
+      }
+    }
+  }
+}
+"""
+
+# GitHub search never returns more than this many results for a single query; larger result
+# sets are fetched as several queries over halved created: date ranges
+SEARCH_RESULT_CAP = 1000
+
+# Public launch of GitHub, used only to pick the midpoint when splitting a created: range. The
+# outermost ranges stay open-ended, so repos from the 2007 private beta are still found.
+GITHUB_LAUNCH_DATE = datetime(2008, 1, 1).date()
+
+# How long a live search result is reused (in-process and on disk) before GitHub is queried again
+CACHE_TTL_SECONDS = repo_cache.DEFAULT_TTL_SECONDS
+
+
+# Longest pause (seconds) before the next request when the rate limit is exhausted; longer
+# resets fail fast so the snapshot fallback kicks in instead of hanging the page
+MAX_RATE_LIMIT_WAIT = 60
+
+# Search pages fetched concurrently; the session keeps this many connections open so every
+# worker reuses a warm keep-alive connection instead of opening (and dropping) a new one
+MAX_PARALLEL_PAGES = 10
+
+
+@st.cache_resource(show_spinner=False)
+def get_http_session():
+    """Keep-alive session shared by all sessions and reruns, so TLS setup is paid once per process.
+
+    Transient failures (429 and 5xx) are retried with exponential backoff, honouring Retry-After.
+    Connection errors and timeouts are not retried, so an unreachable GitHub falls back to the
+    snapshot immediately.
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        connect=0,
+        read=0,
+        other=0,
+        status=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 502, 503, 504],
+        allowed_methods=frozenset({"GET", "POST"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=MAX_PARALLEL_PAGES, max_retries=retry))
+    return session
+
+
+@st.cache_resource(show_spinner=False)
+def github_rate_limit_status():
+    """Rate limit reported by the latest GitHub response in this process ({"remaining", "limit", "reset_at"})."""
+    return {}
+
+
+def _record_rate_limit(response):
+    """Store the rate limit reported by *response* in github_rate_limit_status()."""
+    try:
+        remaining = int(response.headers.get("X-RateLimit-Remaining"))
+        reset_at = int(response.headers.get("X-RateLimit-Reset"))
+    except (TypeError, ValueError):
+        return
+    github_rate_limit_status().update(
+        remaining=remaining, limit=response.headers.get("X-RateLimit-Limit"), reset_at=reset_at
+    )
+
+
+def _wait_for_rate_limit():
+    """Sleep until the rate limit window resets when the last response used up its final request.
+
+    Called only before a follow-up request, so a fetch whose last response exhausts the limit
+    returns immediately.
+    """
+    status = github_rate_limit_status()
+    if status.get("remaining") != 0:
+        return
+    wait = status["reset_at"] - time.time()
+    if 0 < wait <= MAX_RATE_LIMIT_WAIT:
+        time.sleep(wait)
+
+
+def _last_page_from_links(response):
+    """Page number of the Link rel="last" URL of *response*, or None when absent."""
+    last_url = response.links.get("last", {}).get("url")
+    if not last_url:
+        return None
+    try:
+        return int(parse_qs(urlparse(last_url).query)["page"][0])
+    except (KeyError, IndexError, ValueError):
+        return None
+
+
+def _fetch_search_page(params, headers, conditional=False):
+    """Fetch one search result page; returns (status_code, body, last_page).
+
+    *last_page* comes from the Link header (None when GitHub did not send one).
+
+    Runs in worker threads, so it must not call Streamlit. With *conditional*, the ETag of the
+    last copy of this page is sent and a 304 reply reuses that copy.
+    """
+    page_file = repo_cache.page_cache_path(params)
+    cached_page = repo_cache.read_cached_page(page_file) if conditional else None
+    if cached_page:
+        headers = {**headers, "If-None-Match": cached_page["etag"]}
+
+    response = get_http_session().get(GITHUB_API_URL, params=params, headers=headers, timeout=10)
+    _record_rate_limit(response)
+    if response.status_code == 304 and cached_page:
+        repo_cache.touch_cached_page(page_file)
+        return 200, cached_page["body"], _last_page_from_links(response)
+    if response.status_code != 200:
+        return response.status_code, None, None
+
+    body = orjson.loads(response.content)
+    etag = response.headers.get("ETag")
+    if conditional and etag:
+        repo_cache.write_cached_page(page_file, etag, body)
+    return 200, body, _last_page_from_links(response)
+
+
+def _created_query(query, created):
+    """*query* restricted to repos created within the (start, end) dates of *created*, if given.
+
+    A None start or end leaves that side of the range open.
+    """
+    if created is None:
+        return query
+    start, end = created
+    if start is None:
+        return f"{query} created:<={end:%Y-%m-%d}"
+    if end is None:
+        return f"{query} created:>={start:%Y-%m-%d}"
+    return f"{query} created:{start:%Y-%m-%d}..{end:%Y-%m-%d}"
+
+
+def _created_bounds(created):
+    """Concrete (start, end) dates of a created: range, with open sides closed at GitHub's launch
+    and today (in UTC, like GitHub's created: qualifier)."""
+    start, end = created or (None, None)
+    return start or GITHUB_LAUNCH_DATE, end or datetime.now(timezone.utc).date()
+
+
+def _needs_created_split(total_count, per_page, max_pages, created):
+    """True when a query hits the search result cap while the caller asked for every result
+    and its creation date range can still be narrowed."""
+    return (
+        total_count is not None
+        and total_count >= SEARCH_RESULT_CAP
+        and per_page * max_pages >= SEARCH_RESULT_CAP
+        and _created_bounds(created)[0] < _created_bounds(created)[1]
+    )
+
+
+def _fetch_created_halves(fetch_range, created, sort, order):
+    """Run *fetch_range* on both halves of the *created* range (None = all of GitHub's history).
+
+    The first half keeps the open start and the second half the open end of *created*, so no
+    repo falls outside the split. Returns (status_code, repos) with repos deduplicated by id and
+    sorted like a single search.
+    """
+    start, end = created or (None, None)
+    low, high = _created_bounds(created)
+    middle = low + (high - low) // 2
+    repos_by_id = {}
+    for half in ((start, middle), (middle + timedelta(days=1), end)):
+        _wait_for_rate_limit()
+        status_code, repos = fetch_range(half)
+        if status_code != 200:
+            return status_code, list(repos_by_id.values())
+        for repo in repos:
+            repos_by_id.setdefault(repo["id"], repo)
+
+    repos = list(repos_by_id.values())
+    sort_field = {"stars": "stargazers_count", "forks": "forks", "updated": "pushed_at"}.get(sort)
+    if sort_field:
+        repos.sort(key=lambda repo: repo[sort_field], reverse=order == "desc")
+    return 200, repos
+
+
+def _fetch_rest_repos(query, sort, order, per_page, max_pages, headers, conditional=False, created=None):
+    """Fetch search results from the REST API; returns (status_code, repos).
+
+    Page 1 is a probe that tells how many pages exist (Link rel="last", else total_count); only
+    the remaining pages are then fetched, concurrently. With *conditional*, every page is sent as
+    a conditional request. Queries hitting the result cap are split by creation date.
+    """
+    def page_params(page):
+        return {
+            "q": _created_query(query, created),
+            "sort": sort,
+            "order": order,
+            "per_page": per_page,
+            "page": page
+        }
+
+    status_code, first_page, last_page = _fetch_search_page(page_params(1), headers, conditional)
+    if status_code != 200:
+        return status_code, []
+
+    repos = list(first_page["items"])
+    total_count = first_page.get("total_count")
+    if _needs_created_split(total_count, per_page, max_pages, created):
+        return _fetch_created_halves(
+            lambda half: _fetch_rest_repos(query, sort, order, per_page, max_pages, headers, conditional, half),
+            created, sort, order,
+        )
+    if last_page is None and total_count is not None:
+        last_page = math.ceil(min(total_count, SEARCH_RESULT_CAP) / per_page)
+    last_page = min(max_pages, last_page or max_pages)
+    # A short first page is also the last one
+    if len(repos) < per_page or last_page < 2:
+        return 200, repos
+
+    _wait_for_rate_limit()
+    with ThreadPoolExecutor(max_workers=min(last_page - 1, MAX_PARALLEL_PAGES)) as executor:
+        pages = list(executor.map(
+            lambda page: _fetch_search_page(page_params(page), headers, conditional),
+            range(2, last_page + 1),
+        ))
+    for status_code, body, _ in pages:
+        if status_code != 200:
+            return status_code, repos
+        repos.extend(body["items"])
+        if len(body["items"]) < per_page:
+            break
+    return 200, repos
+
+
+def _graphql_node_to_repo(node):
+    """Map a GraphQL Repository node to the REST search item shape used across the app."""
+    return {
+        "id": node["databaseId"],
+        "name": node["name"],
+        "stargazers_count": node["stargazerCount"],
+        "pushed_at": node["pushedAt"],
+        "created_at": node["createdAt"],
+        "html_url": node["url"],
+        "forks": node["forkCount"],
+        # REST open_issues counts open pull requests as well
+        "open_issues": node["issues"]["totalCount"] + node["pullRequests"]["totalCount"],
+        "language": (node.get("primaryLanguage") or {}).get("name"),
+        "license": {"name": node["licenseInfo"]["name"]} if node.get("licenseInfo") else None,
+        "description": node.get("description"),
+        "topics": [t["topic"]["name"] for t in node["repositoryTopics"]["nodes"]],
+    }
+
+
+def _fetch_graphql_repos(query, sort, order, per_page, max_pages, headers, created=None):
+    """Fetch search results from the GraphQL API; returns (status_code, repos).
+
+    Queries hitting the result cap are split by creation date.
+    """
+    repos = []
+    cursor = None
+    for page in range(max_pages):
+        if page:
+            _wait_for_rate_limit()
+        response = get_http_session().post(
+            GITHUB_GRAPHQL_URL,
+            json={
+                "query": GRAPHQL_SEARCH_QUERY,
+                "variables": {
+                    "q": f"{_created_query(query, created)} sort:{sort}-{order}",
+                    "first": per_page,
+                    "after": cursor,
+                },
+            },
+            headers=headers,
+            timeout=10,
+        )
+        _record_rate_limit(response)
+        if response.status_code != 200:
+            return response.status_code, repos
+        payload = orjson.loads(response.content)
+        if payload.get("errors"):
+            raise RuntimeError(payload["errors"][0].get("message", "GraphQL query failed"))
+
+        search = payload["data"]["search"]
+        if page == 0 and _needs_created_split(search.get("repositoryCount"), per_page, max_pages, created):
+            return _fetch_created_halves(
+                lambda half: _fetch_graphql_repos(query, sort, order, per_page, max_pages, headers, half),
+                created, sort, order,
+            )
+        repos.extend(_graphql_node_to_repo(node) for node in search["nodes"] if node)
+        if not search["pageInfo"]["hasNextPage"]:
+            break
+        cursor = search["pageInfo"]["endCursor"]
+    return 200, repos
+
+
 # Function to fetch repositories. Only repos with stars > 50 and updated in the last year are shown
 # Returns (repos, data_from_live_api).
 # Pass *github_token* so search requests use the GitHub API with auth — on Streamlit Cloud the
 # shared egress IP hits the anonymous search rate limit (60/h) almost immediately; without a
-# token the app falls back to bundled CSV and auto-snapshot is skipped.
+# token the app falls back to bundled CSV and auto-snapshot is skipped. With a token the
+# GraphQL search API is used, which returns only the fields the dashboard needs.
+# Pass *cache_ttl* (seconds) to serve a fresh on-disk copy of a previous live result before any
+# network call; successful live results are then written back to the cache.
 def fetch_uml_repos(
     query="uml",
     sort="stars",
@@ -44,8 +373,16 @@ def fetch_uml_repos(
     per_page=100,
     max_pages=10,
     github_token=None,
+    cache_ttl=None,
 ):
     query += " stars:>=" + "50" + " pushed:>=" + (datetime.now() - timedelta(days=365)).strftime("%Y-%m-%d")
+
+    cache_file = repo_cache.cache_path(query, sort, order, per_page, max_pages)
+    if cache_ttl:
+        cached_repos = repo_cache.read_cached_repos(cache_file, cache_ttl)
+        if cached_repos:
+            return cached_repos, True
+
     all_repos = []
     api_failed = False
 
@@ -53,29 +390,28 @@ def fetch_uml_repos(
     if github_token:
         headers["Authorization"] = f"Bearer {github_token}"
 
-    for page in range(1, max_pages + 1):
-        params = {
-            "q": query,
-            "sort": sort,
-            "order": order,
-            "per_page": per_page,
-            "page": page
-        }
-        try:
-            response = requests.get(GITHUB_API_URL, params=params, headers=headers, timeout=10)
-            if response.status_code == 200:
-                repos = response.json()["items"]
-                if not repos:
-                    break
-                all_repos.extend(repos)
-            else:
-                st.error(f"Error fetching data from GitHub API: {response.status_code}")
-                api_failed = True
-                break
-        except Exception as e:
-            st.error(f"GitHub API request failed: {str(e)}")
+    # The GraphQL API returns only the fields the dashboard uses but requires authentication;
+    # anonymous sessions keep using the REST search endpoint.
+    try:
+        if github_token:
+            status_code, all_repos = _fetch_graphql_repos(query, sort, order, per_page, max_pages, headers)
+        else:
+            status_code, all_repos = _fetch_rest_repos(
+                query, sort, order, per_page, max_pages, headers, bool(cache_ttl)
+            )
+        if status_code != 200:
+            st.error(f"Error fetching data from GitHub API: {status_code}")
             api_failed = True
-            break
+    except Exception as e:
+        st.error(f"GitHub API request failed: {str(e)}")
+        api_failed = True
+
+    if cache_ttl and all_repos and not api_failed:
+        repo_cache.write_cached_repos(cache_file, all_repos)
+        # Every page of this search was just written or confirmed, so older files are leftovers
+        # (earlier days' queries, or pages past the last one)
+        repo_cache.prune_cached_repos(cache_ttl)
+        repo_cache.prune_cached_pages(cache_ttl)
 
     loaded_from_snapshot = False
     # If API failed or returned no data, load from bundled snapshot CSV
@@ -86,25 +422,7 @@ def fetch_uml_repos(
                 st.warning(
                     f"⚠️ GitHub API is unavailable. Loading data from {SNAPSHOT_CSV_PATH} instead."
                 )
-                df = pd.read_csv(SNAPSHOT_CSV_PATH, encoding='utf-8-sig')
-
-                # Convert CSV data back to GitHub API format
-                all_repos = []
-                for _, row in df.iterrows():
-                    repo_data = {
-                        "name": row["Name"],
-                        "stargazers_count": row["Stars⭐"],
-                        "pushed_at": row["Last Updated"] + "T00:00:00Z",
-                        "created_at": row["First Commit"] + "T00:00:00Z",
-                        "html_url": row["URL"],
-                        "forks": row["Forks"],
-                        "open_issues": row["Issues"],
-                        "language": row["Language"] if row["Language"] and row["Language"] != "No language" else None,
-                        "license": {"name": row["License"]} if row["License"] != "No license" else None,
-                        "description": row["Description"] if row["Description"] != "No description" else None,
-                        "topics": row["Topics"].split(",") if pd.notna(row["Topics"]) and row["Topics"] else []
-                    }
-                    all_repos.append(repo_data)
+                all_repos = load_snapshot_repos(SNAPSHOT_CSV_PATH)
 
                 st.info(f"✅ Loaded {len(all_repos)} repositories from snapshot data.")
             else:
@@ -118,16 +436,105 @@ def fetch_uml_repos(
     return all_repos, data_from_live_api
 
 
-# Fetch repositories
-try:
-    _github_token = st.secrets.get("GITHUB_TOKEN")
-except Exception:
-    _github_token = None
+def load_snapshot_repos(csv_path):
+    """Repos of the snapshot CSV at *csv_path*, in GitHub API format.
 
-if 'repos' not in st.session_state:
-    st.session_state.repos, st.session_state.data_from_live_api = fetch_uml_repos(
-        github_token=_github_token
+    The converted list is kept in the disk cache, keyed by the CSV's modification time, so later
+    fallbacks read it back directly instead of parsing and converting the CSV again.
+    """
+    compiled_file = repo_cache.cache_path(csv_path, os.path.getmtime(csv_path), prefix="snapshot")
+    repos = repo_cache.read_cached_repos(compiled_file, ttl=math.inf)
+    if repos is None:
+        df = pd.read_csv(csv_path, encoding='utf-8-sig')
+
+        # Convert CSV data back to GitHub API format
+        repos = snapshot_utils.snapshot_frame_to_repos(df)
+        repo_cache.write_cached_repos(compiled_file, repos)
+        repo_cache.prune_snapshots(compiled_file)
+    return repos
+
+
+# Shared by every session in this process, so only the first visitor after the TTL pays for the
+# GitHub round-trips (or the disk read when another process already refreshed the cache).
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def load_uml_repos(github_token=None):
+    return fetch_uml_repos(github_token=github_token, cache_ttl=CACHE_TTL_SECONDS)
+
+
+# The box plot has no native Streamlit equivalent: cached on the star counts so slider moves
+# that keep the same repos skip rebuilding the figure. A resource cache hands back the figure
+# itself; a data cache would unpickle a copy, which costs more than building it.
+@st.cache_resource(show_spinner=False, max_entries=20)
+def build_star_box_plot(star_counts):
+    # Plotting the distribution of repositories by star count using a boxplot
+    star_box_plot = go.Figure(
+        data=[
+            go.Box(
+                x=star_counts,
+                boxpoints="outliers",  # Show only outliers as points
+                jitter=0.5,
+            )
+        ]
+    )
+    star_box_plot.update_layout(
+        title="Distribution of Repositories by Star Count",
+        xaxis_title="",
+        yaxis_title="Number of Stars",
+        xaxis=dict(showticklabels=False)
     )
+    return star_box_plot
+
+
+def build_repo_frame(repos):
+    """Columnar view of *repos* (same order) built once per session: every table, chart and filter is derived from it."""
+    frame = pd.DataFrame(
+        {
+            "name": pd.Series([repo["name"] for repo in repos], dtype="object"),
+            "stargazers_count": pd.Series([repo["stargazers_count"] for repo in repos], dtype="int64"),
+            "last_updated": pd.Series([repo["pushed_at"] for repo in repos], dtype="object").str[:10],
+            "first_commit": pd.Series([repo["created_at"] for repo in repos], dtype="object").str[:10],
+            "html_url": pd.Series([repo["html_url"] for repo in repos], dtype="object"),
+            "forks": pd.Series([repo["forks"] for repo in repos], dtype="int64"),
+            "open_issues": pd.Series([repo["open_issues"] for repo in repos], dtype="int64"),
+            "language": pd.Series([repo["language"] for repo in repos], dtype="object"),
+            "license_name": pd.Series(
+                [repo["license"]["name"] if repo["license"] else "No license" for repo in repos], dtype="object"
+            ),
+            "description": pd.Series(
+                [(repo["description"] or "No description")[:200] for repo in repos], dtype="object"
+            ),
+            # Joined once here: a plain string column is much smaller to send than a list per row
+            "topics": pd.Series([", ".join(repo["topics"]) for repo in repos], dtype="object"),
+        }
+    )
+    frame["pushed_date"] = pd.to_datetime(frame["last_updated"], format="%Y-%m-%d").values.astype("datetime64[D]")
+    frame["created_year"] = frame["first_commit"].str[:4].astype("int64")
+    return frame
+
+
+# Columns of the repository table, in display order, with their headers.
+TABLE_COLUMNS = {
+    "name": "Name",
+    "stargazers_count": "Stars⭐",
+    "last_updated": "Last Updated",
+    "first_commit": "First Commit",
+    "html_url": "URL",
+    "forks": "Forks",
+    "open_issues": "Issues",
+    "language": "Language",
+    "license_name": "License",
+    "description": "Description",
+    "topics": "Topics",
+}
+
+
+def filter_mask(repo_frame, min_stars, min_date):
+    """Boolean mask of the repos with at least *min_stars* stars and a last commit on or after *min_date*."""
+    return (
+        (repo_frame["stargazers_count"].to_numpy() >= min_stars)
+        & (repo_frame["pushed_date"].to_numpy() >= np.datetime64(min_date, "D"))
+    )
+
 
 # List of excluded repositories
 excluded_repos = {
@@ -159,40 +566,54 @@ excluded_repos = {
     "csdn2md",
 }
 
-# Filter out excluded repositories
-st.session_state.repos = [repo for repo in st.session_state.repos if repo['name'] not in excluded_repos]
+def _read_secret(key, default=None):
+    """Streamlit secret *key*, or *default* when it is missing or no secrets file exists."""
+    try:
+        return st.secrets.get(key, default)
+    except Exception:
+        return default
+
+
+# Fetch repositories. The token is read once and authenticates every GitHub request
+# (5000 instead of 60 requests per hour), so the CSV fallback is rarely needed.
+_github_token = _read_secret("GITHUB_TOKEN") or os.environ.get("GITHUB_TOKEN")
+
+if 'repos' not in st.session_state:
+    _loaded_repos, st.session_state.data_from_live_api = load_uml_repos(_github_token)
+    # Filter out excluded repositories once per session, not on every rerun
+    st.session_state.repos = [repo for repo in _loaded_repos if repo['name'] not in excluded_repos]
+    if not st.session_state.data_from_live_api:
+        # Do not pin the snapshot fallback for the whole TTL: the next session retries the API.
+        load_uml_repos.clear()
+
+# Parse dates once per session; every slider move then filters with a vectorized mask
+if "repo_frame" not in st.session_state:
+    st.session_state.repo_frame = build_repo_frame(st.session_state.repos)
+    st.session_state.keyword_frame = build_keyword_frame(st.session_state.repos)
 
 if "today" not in st.session_state:
     st.session_state.today = datetime.today()
-_one_year_ago = st.session_state.today - timedelta(days=365)
-# Default table filters (match slider defaults below): min stars 50, last commit within a year.
-repos_for_default_table_view = [
-    repo
-    for repo in st.session_state.repos
-    if repo["stargazers_count"] >= 50
-    and datetime.strptime(repo["pushed_at"].split("T")[0], "%Y-%m-%d").date()
-    >= _one_year_ago.date()
-]
 
 # Auto-snapshot: persist the current live list when no recent snapshot exists.
 # If a GITHUB_TOKEN secret is configured the snapshot is also committed to the
 # repo so it survives Streamlit Cloud restarts (ephemeral filesystem).
 if _running_streamlit_script() and not st.session_state.get('snapshot_taken'):
     if st.session_state.get('data_from_live_api'):
+        # Default table filters (match slider defaults below): min stars 50, last commit within a year.
+        _one_year_ago = st.session_state.today - timedelta(days=365)
+        repos_for_default_table_view = [
+            st.session_state.repos[i]
+            for i in np.flatnonzero(filter_mask(st.session_state.repo_frame, 50, _one_year_ago.date()))
+        ]
         saved_path = snapshot_utils.auto_snapshot(repos_for_default_table_view)
         st.session_state.snapshot_taken = True
         if saved_path:
             filename = os.path.basename(saved_path)
-            try:
-                gh_token = st.secrets.get("GITHUB_TOKEN")
-            except Exception:
-                gh_token = None
-
-            if gh_token:
-                gh_repo = st.secrets.get("GITHUB_REPO", "jcabot/oss-uml-tools")
-                gh_branch = st.secrets.get("GITHUB_BRANCH", "main")
+            if _github_token:
+                gh_repo = _read_secret("GITHUB_REPO", "jcabot/oss-uml-tools")
+                gh_branch = _read_secret("GITHUB_BRANCH", "main")
                 ok, err_detail = snapshot_utils.commit_snapshot_to_github(
-                    saved_path, gh_token, gh_repo, gh_branch
+                    saved_path, _github_token, gh_repo, gh_branch
                 )
                 if ok:
                     st.success(
@@ -251,16 +672,43 @@ st.markdown("""
 
 """)
 
-st.markdown("<a name='quick-notes'></a>", unsafe_allow_html=True)
-st.write("## Quick notes:")
-st.write("- Use the sliders to filter the repositories. Click on a column header to sort the table.")
-st.write("- Hover over the table to search for specific reports or export the table as a CSV file.")
-st.write("- A few global stats are also available at the bottom of the page.")
-st.write("- Suggest improvements via the [GitHub repository of this dashboard](https://github.com/jcabot/oss-uml-tools)")
+# Static sections are sent as a single markdown element each (anchor included) to keep reruns cheap
+st.markdown("""
+<a name='quick-notes'></a>
+
+## Quick notes:
+- Use the sliders to filter the repositories. Click on a column header to sort the table.
+- Hover over the table to search for specific reports or export the table as a CSV file.
+- A few global stats are also available at the bottom of the page.
+- Suggest improvements via the [GitHub repository of this dashboard](https://github.com/jcabot/oss-uml-tools)
+""", unsafe_allow_html=True)
+
+# Drop every cached copy of the search results and fetch them again from GitHub
+if st.button("Refresh data"):
+    load_uml_repos.clear()
+    repo_cache.clear_cache()
+    del st.session_state.repos
+    del st.session_state.repo_frame
+    del st.session_state.keyword_frame
+    st.rerun()
+
+with st.expander("GitHub API status"):
+    st.write(f"Authenticated requests: {'yes' if _github_token else 'no (60 requests per hour)'}")
+    _rate_limit = github_rate_limit_status()
+    if _rate_limit:
+        _reset_time = datetime.fromtimestamp(_rate_limit["reset_at"]).strftime("%H:%M:%S")
+        st.write(
+            f"Rate limit remaining: {_rate_limit['remaining']} of {_rate_limit['limit']} "
+            f"(resets at {_reset_time})"
+        )
+    else:
+        st.write("No GitHub API response in this process yet (data served from cache or snapshot).")
 
-# Add anchors before each section
-st.markdown("<a name='repository-filters'></a>", unsafe_allow_html=True)
-st.write("## Repository Filters")
+st.markdown("""
+<a name='repository-filters'></a>
+
+## Repository Filters
+""", unsafe_allow_html=True)
 
 # Add star filter slider
 min_stars = st.slider("Minimum Stars", min_value=50, max_value=50000, value=50, step=50)
@@ -283,155 +731,96 @@ min_date = st.slider(
 
 # Same subset as the main repository table (slider filters). Analysis must use this list.
 filtered_repos = []
+filtered_frame = st.session_state.repo_frame.iloc[0:0]
 if repos:
-    filtered_repos = [
-        repo
-        for repo in repos
-        if repo["stargazers_count"] >= min_stars
-        and datetime.strptime(repo["pushed_at"].split("T")[0], "%Y-%m-%d").date()
-        >= min_date.date()
-    ]
+    filtered_positions = np.flatnonzero(filter_mask(st.session_state.repo_frame, min_stars, min_date.date()))
+    filtered_repos = [repos[i] for i in filtered_positions]
+    filtered_frame = st.session_state.repo_frame.iloc[filtered_positions]
 
 if repos:
     # Create a table with repository information. Only repos with stars >= min_stars and last commit >= min_date are shown
-    table_data = []
-
-  
-    for repo in filtered_repos:
-        table_data.append({
-            "Name": repo["name"],
-            "Stars⭐": repo['stargazers_count'],
-            "Last Updated": repo['pushed_at'].split('T')[0],
-            "First Commit": repo['created_at'].split('T')[0],
-            "URL": repo['html_url'],
-            "Forks": repo['forks'],
-            "Issues": repo['open_issues'],
-            "Language": repo['language'],
-            "License": repo['license']['name'] if repo['license'] else "No license",
-            "Description": (repo["description"] or "No description")[:200],
-            "Topics": repo['topics']
-        })
-    
-    st.write(f"Showing {len(table_data)} repositories")
+    table_frame = filtered_frame[list(TABLE_COLUMNS)].rename(columns=TABLE_COLUMNS)
+
+    st.write(f"Showing {len(table_frame)} repositories")
     st.dataframe(
-        table_data,
+        table_frame,
         column_config={
             "URL": st.column_config.LinkColumn("URL")
         },
         use_container_width=True,
-        height=(len(table_data)+1)*35+3,
+        height=(len(table_frame)+1)*35+3,
         hide_index=True
     )
 
-    st.markdown("<a name='selection-method'></a>", unsafe_allow_html=True)
-    st.subheader("Selection method")
-
     #Write the selection method
+    st.markdown(textwrap.dedent("""
+        <a name='selection-method'></a>
 
+        ### Selection method
 
-    st.write("The selection method is based on the following inclusion criteria:")
-    st.write("- Repositories that declare themselves as UML projects")
-    st.write("- Repositories with more than 50 stars")
-    st.write("- Active repositories (last commit is no more than 1 year ago")
-    st.write("- Tool aims to render, edit or generate from UML models")
-    st.write("and exclusion criteria:")
-    st.write("- Repositories with no information in English")
-    st.write("- Repositories that were just created to host the source code of a published article")
-    st.write("- Repositories that are awesome lists or collection of resources or examples")
-
-    st.write("The final list is the intersection of the above criteria. The final list has also been manually curated to remove projects that use UML in a different sense of what we mean by UML in software engineering.")
-    st.write("For more information about UML tools:")
-    st.write("- See this list of [UML tools](https://modeling-languages.com/uml-tools/)")
-    st.write("- Check out these [UML books](https://modeling-languages.com/list-uml-books/)")
-    st.write("- Play with UML via our open source low-code tool [BESSER](https://github.com/BESSER-PEARL/BESSER) that comes with a web-based UML editor")
-    st.write("- And learn about the role of [UML in modern development approaches](https://lowcode-book.com/)")
-
-    st.markdown("<a name='global-statistics'></a>", unsafe_allow_html=True)
-    st.subheader("Some global stats")
-
-    # Create a list of first commit dates
-    first_commit_dates = [datetime.strptime(repo['created_at'].split('T')[0], '%Y-%m-%d').date() for repo in
-                          filtered_repos]
-
-    # Grouping the data by year
-    years = [date.year for date in first_commit_dates]
-    year_counts = Counter(years)
-
-    # Plotting the distribution of first commit dates by year
-    year_bar_chart = go.Figure(
-        data=[
-            go.Bar(
-                x=list(year_counts.keys()),
-                y=list(year_counts.values()),
-            )
-        ]
-    )
-    year_bar_chart.update_layout(
-        title="Distribution of First Commit Dates by Year",
-        xaxis_title="Year of First Commit",
-        yaxis_title="Number of Repositories",
-        xaxis=dict(tickangle=45)
-    )
+        The selection method is based on the following inclusion criteria:
+        - Repositories that declare themselves as UML projects
+        - Repositories with more than 50 stars
+        - Active repositories (last commit is no more than 1 year ago
+        - Tool aims to render, edit or generate from UML models
 
-    # Create a list of star counts
-    star_counts = [repo['stargazers_count'] for repo in filtered_repos]
+        and exclusion criteria:
+        - Repositories with no information in English
+        - Repositories that were just created to host the source code of a published article
+        - Repositories that are awesome lists or collection of resources or examples
 
-    # Plotting the distribution of repositories by star count using a boxplot
-    star_box_plot = go.Figure(
-        data=[
-            go.Box(
-                x=star_counts,
-                boxpoints="outliers",  # Show only outliers as points
-                jitter=0.5,
-            )
-        ]
-    )
-    star_box_plot.update_layout(
-        title="Distribution of Repositories by Star Count",
-        xaxis_title="",
-        yaxis_title="Number of Stars",
-        xaxis=dict(showticklabels=False)
-    )
+        The final list is the intersection of the above criteria. The final list has also been manually curated to remove projects that use UML in a different sense of what we mean by UML in software engineering.
 
-    # Create a list of languages from filtered_repos
-    languages = [repo['language'] for repo in filtered_repos if repo['language']]
+        For more information about UML tools:
+        - See this list of [UML tools](https://modeling-languages.com/uml-tools/)
+        - Check out these [UML books](https://modeling-languages.com/list-uml-books/)
+        - Play with UML via our open source low-code tool [BESSER](https://github.com/BESSER-PEARL/BESSER) that comes with a web-based UML editor
+        - And learn about the role of [UML in modern development approaches](https://lowcode-book.com/)
+    """), unsafe_allow_html=True)
 
-    # Count the occurrences of each language
-    language_counts = Counter(languages)
+    st.markdown(textwrap.dedent("""
+        <a name='global-statistics'></a>
 
-    # Plotting the aggregation of repositories by language
-    language_bar_chart = go.Figure(
-        data=[
-            go.Bar(
-                x=list(language_counts.keys()),
-                y=list(language_counts.values()),
-            )
-        ]
-    )
-    language_bar_chart.update_layout(
-        title="Aggregation of Repositories by Language",
-        xaxis_title="Programming Language",
-        yaxis_title="Number of Repositories",
-        xaxis=dict(tickangle=45)
-    )
+        ### Some global stats
+    """), unsafe_allow_html=True)
 
-    cols = st.columns(2)
-    with cols[0]:
-        st.plotly_chart(year_bar_chart, use_container_width=True)
-        st.plotly_chart(language_bar_chart, use_container_width=True)
-    with cols[1]:
-        st.plotly_chart(star_box_plot, use_container_width=True)
+    # Charts of an empty selection would be blank (and make Altair warn on every rerun)
+    if filtered_frame.empty:
+        st.write("No repositories match the current filters.")
+    else:
+        # Grouping the data by year (as strings so the axis shows 2015, not 2,015)
+        first_commit_years = filtered_frame["created_year"].value_counts().sort_index()
+        first_commit_years.index = first_commit_years.index.astype(str)
+
+        # Count the occurrences of each language
+        language_counts = filtered_frame["language"].value_counts()
+
+        cols = st.columns(2)
+        with cols[0]:
+            st.markdown("**Distribution of First Commit Dates by Year**")
+            st.bar_chart(first_commit_years, x_label="Year of First Commit", y_label="Number of Repositories")
+            st.markdown("**Aggregation of Repositories by Language**")
+            st.bar_chart(language_counts, x_label="Programming Language", y_label="Number of Repositories")
+        with cols[1]:
+            st.plotly_chart(
+                build_star_box_plot(filtered_frame["stargazers_count"].to_numpy()), use_container_width=True
+            )
 
     # Keyword breakdowns use *only* filtered_repos — same list as the dataframe above.
-    st.markdown("<a name='repository-analysis'></a>", unsafe_allow_html=True)
-    st.write("## Repository Analysis")
+    st.markdown(textwrap.dedent("""
+        <a name='repository-analysis'></a>
+
+        ## Repository Analysis
+    """), unsafe_allow_html=True)
     st.caption(
         "Only repositories that appear in the repository table above (with your current "
         "Minimum Stars and Last Commit settings) are included; each subsection is a subset of that list."
     )
+    keyword_frame = st.session_state.keyword_frame.iloc[filtered_positions]
+    analysis_fingerprint = repos_fingerprint(filtered_repos)
     for keyword in ["nocode", "lowcode", "ai", "plantuml", "ocl"]:
         st.write(f"### Analysis for '{keyword}'")
-        display_analysis(filtered_repos, keyword)
+        display_analysis(filtered_repos, keyword, keyword_frame, analysis_fingerprint)
         st.markdown("---")
 
 else:
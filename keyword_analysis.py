@@ -1,68 +1,135 @@
+import hashlib
+import re
+
+import numpy as np
+import orjson
+import pandas as pd
 import streamlit as st
 import plotly.graph_objects as go
 
 
-def analyze_repos_multiple_keywords(repos, keywords, category_name):
-    """Analyze repositories for multiple keywords within a category"""
-    matching_repos = []
-    non_matching_repos = []
-
-    for repo in repos:
-        description = (repo.get("description", "") or "").lower()
-        name = (repo.get("name", "") or "").lower()
-        topics = [t.lower() for t in repo.get("topics", [])]
-
-        matches = any(
-            (
-                keyword in description
-                if keyword != "ai"
-                else (" ai " in description or " ai-" in description)
-            )
-            or (
-                keyword in name
-                if keyword != "ai"
-                else (" ai " in name or " ai-" in name)
-            )
-            or any(keyword == topic.strip() for topic in topics)
-            for keyword in keywords
-        )
-
-        if matches:
-            matching_repos.append(repo)
-        else:
-            non_matching_repos.append(repo)
-
-    return matching_repos, non_matching_repos
-
-
-def display_analysis(table_repos, category):
-    """Pie chart + table for *category*. *table_repos* must match the main repository table."""
-    keyword_sets = {
+# Keywords are matched against lowercased text, so they are lowercased once here
+KEYWORD_SETS = {
+    category: tuple(keyword.lower() for keyword in keywords)
+    for category, keywords in {
         "nocode": ["nocode", "no-code", "no code"],
         "lowcode": ["lowcode", "low code", "low-code"],
         "ai": ["ai", "artificial intelligence"],
         "plantuml": ["plantuml", "plant uml", "plant-uml"],
         "ocl": ["ocl", "object-constraint-language", "object constraint language"],
+    }.items()
+}
+
+
+def _text_patterns(keyword):
+    # "ai" is too short for a plain substring match ("maintain", "email", ...)
+    return [" ai ", " ai-"] if keyword == "ai" else [keyword]
+
+
+def _compile_keyword_matcher(keyword_sets):
+    """Build one regex finding every keyword of every category in a single scan.
+
+    Returns (regex, categories by matched text, categories by topic). The lookahead reports a
+    match at every position, so overlapping keywords are all found. When several patterns start
+    at the same position only the longest is reported, so each match also counts for the
+    categories of the patterns it starts with.
+    """
+    categories_by_pattern = {}
+    categories_by_topic = {}
+    for category, keywords in keyword_sets.items():
+        for keyword in keywords:
+            categories_by_topic.setdefault(keyword, set()).add(category)
+            for pattern in _text_patterns(keyword):
+                categories_by_pattern.setdefault(pattern, set()).add(category)
+
+    patterns = sorted(categories_by_pattern, key=len, reverse=True)
+    regex = re.compile("(?=(" + "|".join(re.escape(p) for p in patterns) + "))")
+    categories_by_match = {
+        match: frozenset().union(*(cats for p, cats in categories_by_pattern.items() if match.startswith(p)))
+        for match in patterns
     }
+    return regex, categories_by_match, categories_by_topic
 
-    repos_to_analyze = table_repos
 
-    allowed_urls = frozenset(
-        r.get("html_url") for r in table_repos if r.get("html_url")
-    )
+_KEYWORD_RE, _CATEGORIES_BY_MATCH, _CATEGORIES_BY_TOPIC = _compile_keyword_matcher(KEYWORD_SETS)
+
 
-    matching_repos, _non_matching_repos = analyze_repos_multiple_keywords(
-        repos_to_analyze,
-        keyword_sets[category],
-        category,
+def build_keyword_frame(repos):
+    """Lowercased text of *repos*, one row per repo (same order), plus a boolean
+    ``_is_<category>`` column per KEYWORD_SETS category computed in a single scan per repo.
+    """
+    frame = pd.DataFrame(
+        {
+            "_desc_l": pd.Series([repo.get("description") or "" for repo in repos], dtype="object").str.lower(),
+            "_name_l": pd.Series([repo.get("name") or "" for repo in repos], dtype="object").str.lower(),
+            "_topics_l": pd.Series(
+                [{t.lower().strip() for t in repo.get("topics") or []} for repo in repos],
+                dtype="object",
+            ),
+        }
     )
 
-    matching_repos = [
-        r for r in matching_repos if r.get("html_url") in allowed_urls
+    # Keywords never contain a newline, so no match can span description and name
+    found = (frame["_desc_l"] + "\n" + frame["_name_l"]).str.findall(_KEYWORD_RE)
+    repo_categories = [
+        set().union(
+            *(_CATEGORIES_BY_MATCH[m] for m in matches),
+            *(_CATEGORIES_BY_TOPIC[t] for t in topics if t in _CATEGORIES_BY_TOPIC),
+        )
+        for matches, topics in zip(found, frame["_topics_l"])
+    ]
+    for category in KEYWORD_SETS:
+        frame[f"_is_{category}"] = pd.Series(
+            [category in categories for categories in repo_categories], index=frame.index, dtype=bool
+        )
+    return frame
+
+
+def repos_fingerprint(repos):
+    """Short cache key identifying *repos* by URL, last push, star count and the text the analyses use.
+
+    Name, description and topics decide category membership and fill the tables, and they can
+    change without a push, so they are part of the key. The fields are hashed into one digest:
+    Streamlit re-hashes cache arguments on every call, which is costly for a tuple per repo.
+    """
+    return hashlib.sha256(orjson.dumps([
+        (
+            repo.get("html_url"),
+            repo.get("pushed_at"),
+            repo.get("stargazers_count"),
+            repo.get("name"),
+            repo.get("description"),
+            repo.get("topics"),
+        )
+        for repo in repos
+    ])).hexdigest()
+
+
+@st.cache_data(show_spinner=False, max_entries=100)
+def _compute_analysis(fingerprint, category, _table_repos, _keyword_frame=None):
+    """Table rows of the repos of *_table_repos* matching *category*.
+
+    Cached on (*fingerprint*, *category*): slider changes that keep the same repos reuse them.
+    The category columns of the keyword frame already hold the matches, so no other cache is needed.
+    """
+    if _keyword_frame is None:
+        _keyword_frame = build_keyword_frame(_table_repos)
+    return [
+        {
+            "Name": _table_repos[i]["name"],
+            "Description": _table_repos[i].get("description", "No description"),
+            "Stars": _table_repos[i].get("stargazers_count", 0),
+        }
+        for i in np.flatnonzero(_keyword_frame[f"_is_{category}"].to_numpy())
     ]
-    n_match = len(matching_repos)
-    n_non_match = len(repos_to_analyze) - n_match
 
+
+def _build_pie_chart(category, n_match, n_total):
+    """Pie chart of the repos mentioning *category*.
+
+    Not cached: building it is cheaper than unpickling a cached copy.
+    """
+    n_non_match = n_total - n_match
     fig = go.Figure(
         data=[
             go.Pie(
@@ -84,7 +151,7 @@ def display_analysis(table_repos, category):
         height=500,
         annotations=[
             {
-                "text": f"Total: {len(repos_to_analyze)}",
+                "text": f"Total: {n_total}",
                 "x": 0.5,
                 "y": 0.5,
                 "font_size": 20,
@@ -92,19 +159,23 @@ def display_analysis(table_repos, category):
             }
         ],
     )
+    return fig
 
-    st.plotly_chart(fig)
 
-    if matching_repos:
+def display_analysis(table_repos, category, keyword_frame=None, fingerprint=None):
+    """Pie chart + table for *category*. *table_repos* must match the main repository table.
+
+    *keyword_frame* is the optional build_keyword_frame(table_repos) and *fingerprint* the optional
+    repos_fingerprint(table_repos), both computed once and shared across categories.
+    """
+    if fingerprint is None:
+        fingerprint = repos_fingerprint(table_repos)
+    data = _compute_analysis(fingerprint, category, table_repos, keyword_frame)
+
+    st.plotly_chart(_build_pie_chart(category, len(data), len(table_repos)))
+
+    if data:
         st.write(f"### UML Tools Mentioning '{category}'")
-        data = [
-            {
-                "Name": repo["name"],
-                "Description": repo.get("description", "No description"),
-                "Stars": repo.get("stargazers_count", 0),
-            }
-            for repo in matching_repos
-        ]
         st.table(data)
     else:
         st.write(f"No repositories found mentioning '{category}'")
@@ -0,0 +1,137 @@
+"""
+repo_cache.py – On-disk cache for GitHub search results.
+
+Cache files live in cache/ and are named uml_repos_<hash>.json, where the hash
+is derived from the search parameters. Entries older than the TTL are ignored,
+so the bundled snapshot CSV is only used when the cache is stale and the API is
+unavailable.
+
+Individual search result pages are also kept (search_page_<hash>.json) together
+with their ETag, so expired entries can be revalidated with conditional requests.
+Search results and pages not written or revalidated within the TTL are pruned after
+each live search.
+
+The snapshot CSV fallback is stored converted (snapshot_<hash>.json, keyed by the
+CSV's modification time) so it is only parsed again after the CSV changes; older
+conversions are deleted when a new one is written.
+"""
+
+from __future__ import annotations
+
+import glob
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+import orjson
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache")
+DEFAULT_TTL_SECONDS = 6 * 60 * 60
+
+
+def cache_path(*key_parts, prefix: str = "uml_repos") -> str:
+    """Return the cache file path for the search described by *key_parts*."""
+    digest = hashlib.sha256(json.dumps(key_parts).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(CACHE_DIR, f"{prefix}_{digest}.json")
+
+
+def page_cache_path(params: dict) -> str:
+    """Return the cache file path for one search result page described by its request *params*."""
+    return cache_path(*(params[k] for k in sorted(params)), prefix="search_page")
+
+
+def read_cached_repos(path: str, ttl: float = DEFAULT_TTL_SECONDS) -> list[dict] | None:
+    """Return the repos stored at *path*, or None if missing, unreadable or older than *ttl*."""
+    try:
+        if time.time() - os.path.getmtime(path) >= ttl:
+            return None
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+
+def write_cached_repos(path: str, repos: list[dict]) -> None:
+    """Atomically write *repos* to *path* so concurrent sessions never read a partial file."""
+    _write_json(path, repos)
+
+
+def read_cached_page(path: str) -> dict | None:
+    """Return the cached page at *path* ({"etag", "body"}), or None if missing or unreadable."""
+    try:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+
+def write_cached_page(path: str, etag: str, body: dict) -> None:
+    """Store a search result page *body* with the *etag* GitHub returned for it."""
+    _write_json(path, {"etag": etag, "body": body})
+
+
+def _write_json(path: str, data) -> None:
+    # The cache is an optimisation only: a failed write (read-only app directory, full disk,
+    # unencodable data) is dropped so callers never see it
+    tmp_path = None
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(orjson.dumps(data))
+        os.replace(tmp_path, path)
+    except (OSError, orjson.JSONEncodeError):
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+def touch_cached_page(path: str) -> None:
+    """Mark the cached page at *path* as still in use (GitHub confirmed it with a 304)."""
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def prune_cached_repos(ttl: float = DEFAULT_TTL_SECONDS) -> None:
+    """Delete cached search results older than *ttl*.
+
+    Result queries include the current date, so every day leaves an entry nothing reads again.
+    """
+    _remove_files("uml_repos", ttl)
+
+
+def prune_snapshots(current_path: str) -> None:
+    """Delete converted snapshots other than *current_path* (left over from older CSV versions)."""
+    _remove_files("snapshot", keep=current_path)
+
+
+def prune_cached_pages(ttl: float = DEFAULT_TTL_SECONDS) -> None:
+    """Delete cached pages not written or confirmed within *ttl*.
+
+    Page queries include the current date, so every day leaves a set of pages nothing reads again.
+    """
+    _remove_files("search_page", ttl)
+
+
+def clear_cache() -> None:
+    """Delete every cached search result, search result page and converted snapshot."""
+    for prefix in ("uml_repos", "search_page", "snapshot"):
+        _remove_files(prefix)
+
+
+def _remove_files(prefix: str, ttl: float = 0, keep: str | None = None) -> None:
+    now = time.time()
+    for path in glob.glob(os.path.join(CACHE_DIR, f"{prefix}_*.json")):
+        if path == keep:
+            continue
+        try:
+            if now - os.path.getmtime(path) >= ttl:
+                os.remove(path)
+        except OSError:
+            pass
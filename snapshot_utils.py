@@ -63,6 +63,32 @@ def repos_to_csv(repos: list[dict], path: str) -> int:
     return len(rows)
 
 
+def snapshot_frame_to_repos(df: pd.DataFrame) -> list[dict]:
+    """Convert a snapshot CSV loaded with pandas back to GitHub API format.
+
+    Inverse of repos_to_csv: placeholder values ("No language", ...) become None.
+    """
+    def present(column: str, placeholder: str) -> pd.Series:
+        return df[column].notna() & (df[column] != placeholder)
+
+    topics = df["Topics"].fillna("").astype(str)
+    license_names = df["License"].astype(object).where(present("License", "No license"), None)
+    repos = pd.DataFrame({
+        "name": df["Name"],
+        "stargazers_count": df["Stars⭐"],
+        "pushed_at": df["Last Updated"] + "T00:00:00Z",
+        "created_at": df["First Commit"] + "T00:00:00Z",
+        "html_url": df["URL"],
+        "forks": df["Forks"],
+        "open_issues": df["Issues"],
+        "language": df["Language"].astype(object).where(present("Language", "No language"), None),
+        "license": license_names.map(lambda name: {"name": name} if name is not None else None),
+        "description": df["Description"].astype(object).where(present("Description", "No description"), None),
+        "topics": topics.str.split(",").where(topics != "", pd.Series([[]] * len(df), index=df.index)),
+    })
+    return repos.to_dict("records")
+
+
 def auto_snapshot(repos: list[dict]) -> str | None:
     """Save a new snapshot when no snapshot exists in the last 3 months.
 
@@ -0,0 +1,18 @@
+"""
+Shared test helper: give a test module its own temporary cache directory.
+
+Importing app runs its module-level search, which writes to repo_cache.CACHE_DIR, so test
+modules call isolate_cache_dir() from setUpModule before app is imported. Parallel test
+processes then never share the dashboard's cache/ directory.
+"""
+
+import tempfile
+from unittest.mock import patch
+
+
+def isolate_cache_dir(stack):
+    """Point repo_cache.CACHE_DIR at a new temporary directory until *stack* (an ExitStack) closes."""
+    import repo_cache
+    cache_dir = stack.enter_context(tempfile.TemporaryDirectory())
+    stack.enter_context(patch.object(repo_cache, 'CACHE_DIR', cache_dir))
+    return cache_dir
@@ -10,10 +10,12 @@ import os
 import sys
 import csv
 
-# Add parent directory to path to import app modules
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add parent directory to path to import app modules (once, even when several test modules load)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
-def test_required_files_exist():
+def check_required_files_exist():
     """Test that all required files exist."""
     print("Testing required files...")
     required_files = ['app.py', 'keyword_analysis.py', 'requirements.txt', 'snapshots/snapshot-2025-06-06.csv']
@@ -28,28 +30,28 @@ def test_required_files_exist():
     
     return all_exist
 
-def test_csv_basic_format():
+def check_csv_basic_format():
     """Test basic CSV format without pandas."""
     print("\nTesting CSV format...")
     try:
         with open('snapshots/snapshot-2025-06-06.csv', 'r', encoding='utf-8-sig') as f:
             reader = csv.DictReader(f)
-            rows = list(reader)
+            first_row = next(reader, None)
             
-            if len(rows) == 0:
+            if first_row is None:
                 print("[FAIL] No data in bundled snapshot CSV")
                 return False
             
             # Check required columns
             required_columns = ['Name', 'Stars⭐', 'URL']
-            first_row = rows[0]
             
-            for col in required_columns:
-                if col not in first_row:
-                    print(f"[FAIL] Missing column: {col}")
-                    return False
+            missing = set(required_columns).difference(first_row.keys())
+            if missing:
+                print(f"[FAIL] Missing columns: {', '.join(sorted(missing))}")
+                return False
             
-            print(f"[OK] CSV contains {len(rows)} repositories")
+            row_count = 1 + sum(1 for _ in reader)
+            print(f"[OK] CSV contains {row_count} repositories")
             print(f"[OK] Sample: {first_row['Name']} with {first_row['Stars⭐']} stars")
             return True
             
@@ -57,7 +59,7 @@ def test_csv_basic_format():
         print(f"[FAIL] CSV format test failed: {e}")
         return False
 
-def test_app_structure():
+def check_app_structure():
     """Test basic app.py structure without importing it."""
     print("\nTesting app.py structure...")
     try:
@@ -85,7 +87,7 @@ def test_app_structure():
         print(f"[FAIL] App structure test failed: {e}")
         return False
 
-def test_fallback_logic_structure():
+def check_fallback_logic_structure():
     """Test that fallback logic is present in app.py."""
     print("\nTesting fallback logic structure...")
     try:
@@ -114,6 +116,20 @@ def test_fallback_logic_structure():
         print(f"[FAIL] Fallback logic test failed: {e}")
         return False
 
+# pytest entry points: the checks above report failures by returning False, which pytest
+# would not treat as a failure, so each one asserts on its check
+def test_required_files_exist():
+    assert check_required_files_exist()
+
+def test_csv_basic_format():
+    assert check_csv_basic_format()
+
+def test_app_structure():
+    assert check_app_structure()
+
+def test_fallback_logic_structure():
+    assert check_fallback_logic_structure()
+
 def main():
     """Run all basic validation tests."""
     print("=" * 60)
@@ -122,10 +138,10 @@ def main():
     print("This test validates core functionality without external dependencies.\n")
     
     tests = [
-        ("Required Files", test_required_files_exist),
-        ("CSV Format", test_csv_basic_format),
-        ("App Structure", test_app_structure),
-        ("Fallback Logic", test_fallback_logic_structure)
+        ("Required Files", check_required_files_exist),
+        ("CSV Format", check_csv_basic_format),
+        ("App Structure", check_app_structure),
+        ("Fallback Logic", check_fallback_logic_structure)
     ]
     
     results = []
@@ -12,14 +12,69 @@ Usage:
     python tests/test_normal_operation.py
 """
 
+import contextlib
+import functools
+import importlib.util
+import json
+import mmap
 import os
 import sys
 import unittest
-import csv
+import tempfile
 from unittest.mock import patch, MagicMock
 
-# Add parent directory to path to import app modules
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add parent directory to path to import app modules (once, even when several test modules load)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from cache_isolation import isolate_cache_dir
+
+SNAPSHOT_PATH = os.path.join("snapshots", "snapshot-2025-06-06.csv")
+
+# Column types of the bundled snapshot; every other column is read as text
+SNAPSHOT_DTYPES = {"Name": "string", "Stars⭐": "Int64", "Forks": "Int64", "Issues": "Int64"}
+
+@functools.lru_cache(maxsize=None)
+def _load_snapshot(path, mtime):
+    """Return the parsed DataFrame of the snapshot CSV at *path*.
+
+    Cached on (*path*, *mtime*): every test shares one parse, and an edited file is parsed again.
+    """
+    import pandas as pd
+    return pd.read_csv(path, encoding='utf-8-sig', engine="c", dtype=SNAPSHOT_DTYPES, keep_default_na=False)
+
+
+def _missing_files(paths):
+    """Return those of *paths* that do not exist, listing each parent directory only once."""
+    names_by_dir = {}
+    for directory in {os.path.dirname(path) for path in paths}:
+        try:
+            with os.scandir(directory or ".") as entries:
+                names_by_dir[directory] = {entry.name for entry in entries}
+        except OSError:
+            names_by_dir[directory] = set()
+    return [path for path in paths if os.path.basename(path) not in names_by_dir[os.path.dirname(path)]]
+
+
+fetch_uml_repos = None
+_module_stack = contextlib.ExitStack()
+
+
+def setUpModule():
+    """Import app once for the whole module instead of in every test.
+
+    The cache directory is made private first: importing app runs its (cached) search.
+    """
+    global fetch_uml_repos
+    isolate_cache_dir(_module_stack)
+    from app import fetch_uml_repos as _fetch_uml_repos
+    fetch_uml_repos = _fetch_uml_repos
+
+
+def tearDownModule():
+    _module_stack.close()
+
 
 class TestBasicFunctionality(unittest.TestCase):
     """Test basic functionality and file structure."""
@@ -28,9 +83,8 @@ class TestBasicFunctionality(unittest.TestCase):
         """Test that all required files exist."""
         required_files = ['app.py', 'keyword_analysis.py', 'requirements.txt', 'snapshots/snapshot-2025-06-06.csv']
         
-        for filename in required_files:
-            with self.subTest(file=filename):
-                self.assertTrue(os.path.exists(filename), f"{filename} should exist")
+        missing = _missing_files(required_files)
+        self.assertFalse(missing, f"Required files should exist: {missing}")
         
         print("[OK] All required files exist")
     
@@ -47,29 +101,31 @@ class TestBasicFunctionality(unittest.TestCase):
     
     def test_app_import(self):
         """Test that app.py can be imported and contains required functions."""
-        try:
-            from app import fetch_uml_repos
-            self.assertTrue(callable(fetch_uml_repos), "fetch_uml_repos should be callable")
-            print("[OK] App modules imported successfully")
-        except ImportError as e:
-            self.fail(f"Failed to import app modules: {e}")
+        self.assertTrue(callable(fetch_uml_repos), "fetch_uml_repos should be callable")
+        print("[OK] App modules imported successfully")
 
 
 class TestCSVDataHandling(unittest.TestCase):
     """Test CSV data loading and processing."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.snapshot_path = os.path.join("snapshots", "snapshot-2025-06-06.csv")
+    @classmethod
+    def setUpClass(cls):
+        """Read and parse the snapshot once for every test of the class."""
+        cls.snapshot_path = SNAPSHOT_PATH
+        cls.df = _load_snapshot(SNAPSHOT_PATH, os.path.getmtime(SNAPSHOT_PATH))
     
     def test_csv_file_exists_and_readable(self):
         """Test that CSV file exists and is readable."""
         self.assertTrue(os.path.exists(self.snapshot_path), "bundled snapshot CSV should exist")
         
-        with open(self.snapshot_path, 'r', encoding='utf-8-sig') as f:
-            first_line = f.readline().strip()
-            self.assertIn('Name', first_line, "CSV should have Name column")
-            self.assertIn('Stars⭐', first_line, "CSV should have Stars column")
+        # Byte-level check of the header line: no decoding needed to find two column names
+        with open(self.snapshot_path, 'rb') as f, \
+             mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            first_line = mm[:mm.find(b"\n")]
+        self.assertTrue(
+            all(column.encode() in first_line for column in ('Name', 'Stars⭐')),
+            "CSV should have Name and Stars columns"
+        )
         
         print("[OK] CSV file exists and is readable")
     
@@ -79,48 +135,37 @@ class TestCSVDataHandling(unittest.TestCase):
                           'URL', 'Forks', 'Issues', 'Language', 'License', 
                           'Description', 'Topics']
         
-        with open(self.snapshot_path, 'r', encoding='utf-8-sig') as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
-            
-            self.assertGreater(len(rows), 0, "CSV should contain repository data")
-            
-            first_row = rows[0]
-            for col in required_columns:
-                self.assertIn(col, first_row, f"Column '{col}' should exist")
-            
-            # Validate data types and formats
-            self.assertIsInstance(first_row['Name'], str)
-            self.assertTrue(first_row['URL'].startswith('https://github.com/'))
+        df = self.df
+        self.assertGreater(len(df), 0, "CSV should contain repository data")
+        
+        missing = set(required_columns).difference(df.columns)
+        self.assertFalse(missing, f"Missing columns: {missing}")
+        
+        # Validate data types and formats
+        self.assertIsInstance(df['Name'].iloc[0], str)
+        self.assertTrue(df['URL'].str.startswith('https://github.com/').all())
+        # SNAPSHOT_DTYPES already made read_csv reject any non-integer count
+        for column in ("Stars⭐", "Forks", "Issues"):
+            values = df[column]
+            self.assertTrue(values.notna().all(), f"Column '{column}' should have no missing counts")
+            self.assertTrue((values >= 0).all(), f"Column '{column}' should not be negative")
             
-        print(f"[OK] CSV contains {len(rows)} repositories with correct format")
+        print(f"[OK] CSV contains {len(df)} repositories with correct format")
     
     def test_csv_to_api_conversion(self):
         """Test conversion of CSV data to GitHub API format."""
-        with open(self.snapshot_path, 'r', encoding='utf-8-sig') as f:
-            reader = csv.DictReader(f)
-            sample_row = next(reader)
-            
-            # Convert to API format (same logic as in app.py)
-            repo_data = {
-                "name": sample_row["Name"],
-                "stargazers_count": int(sample_row["Stars⭐"]),
-                "pushed_at": sample_row["Last Updated"] + "T00:00:00Z",
-                "created_at": sample_row["First Commit"] + "T00:00:00Z",
-                "html_url": sample_row["URL"],
-                "forks": int(sample_row["Forks"]),
-                "open_issues": int(sample_row["Issues"]),
-                "language": sample_row["Language"] if sample_row["Language"] and sample_row["Language"] != "No language" else None,
-                "license": {"name": sample_row["License"]} if sample_row["License"] != "No license" else None,
-                "description": sample_row["Description"] if sample_row["Description"] != "No description" else None,
-                "topics": sample_row["Topics"].split(",") if sample_row["Topics"] else []
-            }
-            
-            # Validate converted structure
-            self.assertIsInstance(repo_data["name"], str)
-            self.assertIsInstance(repo_data["stargazers_count"], int)
-            self.assertIsInstance(repo_data["topics"], list)
-            self.assertTrue(repo_data["pushed_at"].endswith("T00:00:00Z"))
+        from snapshot_utils import snapshot_frame_to_repos
+
+        # Convert the whole snapshot with the same vectorized logic app.py uses for its fallback
+        repos = snapshot_frame_to_repos(self.df)
+        self.assertEqual(len(repos), len(self.df))
+        repo_data = repos[0]
+        
+        # Validate converted structure
+        self.assertIsInstance(repo_data["name"], str)
+        self.assertIsInstance(repo_data["stargazers_count"], int)
+        self.assertIsInstance(repo_data["topics"], list)
+        self.assertTrue(all(repo["pushed_at"].endswith("T00:00:00Z") for repo in repos))
             
         print(f"[OK] CSV to API conversion works: {repo_data['name']}")
 
@@ -128,9 +173,14 @@ class TestCSVDataHandling(unittest.TestCase):
 class TestNormalAPIOperation(unittest.TestCase):
     """Test normal GitHub API operation with mocks."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.test_repo_data = {
+    @classmethod
+    def setUpClass(cls):
+        """Stub the Streamlit notifications and build the shared fixtures once for the class."""
+        cls._stack = contextlib.ExitStack()
+        for notification in ('streamlit.error', 'streamlit.warning', 'streamlit.info'):
+            cls._stack.enter_context(patch(notification))
+
+        cls.test_repo_data = {
             "name": "test-uml-tool",
             "stargazers_count": 150,
             "pushed_at": "2023-12-01T00:00:00Z",
@@ -143,28 +193,314 @@ class TestNormalAPIOperation(unittest.TestCase):
             "description": "A test UML tool",
             "topics": ["uml", "diagrams", "modeling"]
         }
+
+        # Successful one-page search response returning test_repo_data
+        cls._mock_response = cls._search_response([cls.test_repo_data])
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._stack.close()
+
+    @staticmethod
+    def _search_response(items, links=None, headers=None, status=200, total_count=None, body=None):
+        """Mocked GitHub response whose JSON body lists *items* (or is *body*, for GraphQL)."""
+        response = MagicMock()
+        response.status_code = status
+        response.headers = headers or {}
+        response.links = links or {}
+        if body is None:
+            body = {"items": items} if total_count is None else {"total_count": total_count, "items": items}
+        response.content = json.dumps(body).encode()
+        return response
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_successful_api_call(self, mock_get):
         """Test successful GitHub API response."""
-        # Mock successful API response
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "items": [self.test_repo_data]
-        }
-        mock_get.return_value = mock_response
+        mock_get.return_value = self._mock_response
         
-        with patch('streamlit.error'), patch('streamlit.warning'), patch('streamlit.info'):
-            from app import fetch_uml_repos
-            repos, _ = fetch_uml_repos(max_pages=1)
-            
-            self.assertGreater(len(repos), 0, "Should return repositories")
-            self.assertEqual(repos[0]["name"], "test-uml-tool")
-            self.assertEqual(repos[0]["stargazers_count"], 150)
+        repos, _ = fetch_uml_repos(max_pages=1)
+
+        self.assertGreater(len(repos), 0, "Should return repositories")
+        self.assertEqual(repos[0]["name"], "test-uml-tool")
+        self.assertEqual(repos[0]["stargazers_count"], 150)
         
         print("[OK] Normal API operation works correctly")
 
+    @patch('requests.Session.get')
+    def test_fresh_disk_cache_skips_api(self, mock_get):
+        """Test that a fresh on-disk cache entry is served without calling the API."""
+        import repo_cache
+        mock_get.return_value = self._mock_response
+
+        with tempfile.TemporaryDirectory() as cache_dir, \
+             patch.object(repo_cache, 'CACHE_DIR', cache_dir):
+            fetch_uml_repos(max_pages=1, cache_ttl=60)
+            self.assertEqual(mock_get.call_count, 1)
+
+            repos, data_from_live_api = fetch_uml_repos(max_pages=1, cache_ttl=60)
+            self.assertEqual(mock_get.call_count, 1, "Cached result should skip the API")
+            self.assertTrue(data_from_live_api)
+            self.assertEqual(repos[0]["name"], "test-uml-tool")
+
+        print("[OK] Disk cache serves repositories without API calls")
+
+    @patch('requests.Session.get')
+    def test_unwritable_cache_keeps_live_results(self, mock_get):
+        """Test that a cache directory that cannot be created does not turn a live result into a failure."""
+        import repo_cache
+        mock_get.return_value = self._mock_response
+
+        with tempfile.NamedTemporaryFile() as not_a_directory, \
+             patch.object(repo_cache, 'CACHE_DIR', os.path.join(not_a_directory.name, "cache")):
+            repos, data_from_live_api = fetch_uml_repos(max_pages=1, cache_ttl=60)
+
+        self.assertTrue(data_from_live_api)
+        self.assertEqual(repos[0]["name"], "test-uml-tool")
+
+        print("[OK] Cache write failures are ignored")
+
+    @patch('requests.Session.get')
+    def test_pages_fetched_up_to_last_link(self, mock_get):
+        """Test that only the pages up to the Link rel="last" page are requested."""
+        mock_get.return_value = self._search_response(
+            [self.test_repo_data],
+            links={"last": {"url": "https://api.github.com/search/repositories?q=uml&page=3"}},
+            total_count=250,
+        )
+
+        repos, data_from_live_api = fetch_uml_repos(per_page=1, max_pages=10)
+
+        requested_pages = sorted(call.kwargs["params"]["page"] for call in mock_get.call_args_list)
+        self.assertEqual(requested_pages, [1, 2, 3])
+        self.assertEqual(len(repos), 3)
+        self.assertTrue(data_from_live_api)
+
+        print("[OK] Pagination stops at the last page reported by the API")
+
+    @patch('time.sleep')
+    @patch('requests.Session.get')
+    def test_exhausted_rate_limit_waits_only_before_next_request(self, mock_get, mock_sleep):
+        """Test that an exhausted rate limit delays the next request but never the last response."""
+        import time
+        from app import github_rate_limit_status
+
+        exhausted = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(int(time.time()) + 30)}
+
+        self.addCleanup(github_rate_limit_status().clear)
+        mock_get.return_value = self._search_response([self.test_repo_data], headers=exhausted)
+        fetch_uml_repos(max_pages=1)
+        mock_sleep.assert_not_called()
+
+        mock_get.return_value = self._search_response(
+            [self.test_repo_data],
+            links={"last": {"url": "https://api.github.com/search/repositories?q=uml&page=2"}},
+            headers=exhausted,
+        )
+        fetch_uml_repos(per_page=1, max_pages=2)
+        mock_sleep.assert_called_once()
+
+        print("[OK] Rate limit waits happen only before a follow-up request")
+
+    @patch('requests.Session.get')
+    def test_capped_search_is_split_by_creation_date(self, mock_get):
+        """Test that a search over the 1000-result cap is split into open-ended created: date ranges."""
+        def make_repo(repo_id, stars):
+            return dict(self.test_repo_data, id=repo_id, name=f"tool-{repo_id}", stargazers_count=stars)
+
+        def fake_get(url, params, headers, timeout):
+            if "created:<=" in params["q"]:
+                items = [make_repo(1, 60), make_repo(2, 500)]
+            elif "created:" in params["q"]:
+                items = [make_repo(2, 500), make_repo(3, 90)]
+            else:
+                items = [make_repo(1, 60)] * params["per_page"]
+            return self._search_response(
+                items, total_count=len(items) if "created:" in params["q"] else 1500
+            )
+
+        mock_get.side_effect = fake_get
+
+        repos, data_from_live_api = fetch_uml_repos(max_pages=10)
+
+        self.assertTrue(data_from_live_api)
+        self.assertEqual([repo["id"] for repo in repos], [2, 3, 1], "Deduplicated and sorted by stars")
+        split_queries = [call.kwargs["params"]["q"] for call in mock_get.call_args_list][1:]
+        self.assertEqual(len(split_queries), 2)
+        self.assertIn("created:<=", split_queries[0], "Repos created before GitHub's launch are kept")
+        self.assertIn("created:>=", split_queries[1], "Repos created later today (UTC) are kept")
+
+        print("[OK] Capped searches are split by creation date")
+
+    @patch('requests.Session.get')
+    def test_not_modified_page_reuses_cached_copy(self, mock_get):
+        """Test that a 304 reply reuses the stored page and that only unconfirmed pages are pruned."""
+        import glob
+        import time
+        import repo_cache
+        mock_get.side_effect = [
+            self._search_response([self.test_repo_data], headers={"ETag": '"abc"'}),
+            self._search_response([], status=304),
+        ]
+
+        with tempfile.TemporaryDirectory() as cache_dir, \
+             patch.object(repo_cache, 'CACHE_DIR', cache_dir):
+            fetch_uml_repos(max_pages=1, cache_ttl=60)
+            (page_file,) = glob.glob(os.path.join(cache_dir, "search_page_*.json"))
+            leftover_page = repo_cache.page_cache_path({"q": "uml pushed:>=2000-01-01", "page": 1})
+            repo_cache.write_cached_page(leftover_page, '"old"', {"items": []})
+            leftover_result = repo_cache.cache_path("uml pushed:>=2000-01-01", "stars", "desc", 100, 1)
+            repo_cache.write_cached_repos(leftover_result, [])
+            # Age every cached file past the TTL, as a later visit would find them
+            expired = time.time() - 120
+            for path in os.listdir(cache_dir):
+                os.utime(os.path.join(cache_dir, path), (expired, expired))
+
+            repos, data_from_live_api = fetch_uml_repos(max_pages=1, cache_ttl=60)
+
+            self.assertTrue(os.path.exists(page_file), "Confirmed page should be kept")
+            self.assertFalse(os.path.exists(leftover_page), "Unused page should be pruned")
+            self.assertFalse(os.path.exists(leftover_result), "Expired result should be pruned")
+            repo_cache.clear_cache()
+            self.assertEqual(os.listdir(cache_dir), [], "Refresh should drop every cached file")
+
+        self.assertEqual(mock_get.call_args.kwargs["headers"]["If-None-Match"], '"abc"')
+        self.assertTrue(data_from_live_api)
+        self.assertEqual(repos[0]["name"], "test-uml-tool")
+
+        print("[OK] Conditional requests reuse unchanged pages")
+
+    @patch('requests.Session.post')
+    def test_graphql_search_with_token(self, mock_post):
+        """Test that authenticated searches use GraphQL and map nodes to the REST shape."""
+        mock_post.return_value = self._search_response(None, body={
+            "data": {
+                "search": {
+                    "pageInfo": {"endCursor": "Y3Vyc29yOjE=", "hasNextPage": False},
+                    "nodes": [{
+                        "databaseId": 42,
+                        "name": "test-uml-tool",
+                        "stargazerCount": 150,
+                        "pushedAt": "2023-12-01T00:00:00Z",
+                        "createdAt": "2023-01-01T00:00:00Z",
+                        "url": "https://github.com/test/test-uml-tool",
+                        "forkCount": 25,
+                        "issues": {"totalCount": 2},
+                        "pullRequests": {"totalCount": 1},
+                        "primaryLanguage": {"name": "Java"},
+                        "licenseInfo": {"name": "MIT License"},
+                        "description": "A test UML tool",
+                        "repositoryTopics": {"nodes": [
+                            {"topic": {"name": "uml"}},
+                            {"topic": {"name": "diagrams"}},
+                            {"topic": {"name": "modeling"}},
+                        ]},
+                    }],
+                }
+            }
+        })
+
+        repos, data_from_live_api = fetch_uml_repos(max_pages=1, github_token="token")
+
+        self.assertTrue(data_from_live_api)
+        self.assertEqual(mock_post.call_args.kwargs["headers"]["Authorization"], "Bearer token")
+        expected = dict(self.test_repo_data, id=42)
+        self.assertEqual(repos, [expected])
+
+        print("[OK] GraphQL search results match the REST format")
+
+    def test_network_errors_are_not_retried(self):
+        """Test that only error statuses are retried, so an unreachable GitHub falls back at once."""
+        from app import get_http_session
+        retry = get_http_session().get_adapter("https://api.github.com").max_retries
+
+        self.assertEqual((retry.connect, retry.read, retry.other), (0, 0, 0))
+        self.assertGreater(retry.status, 0)
+
+    def test_graphql_node_parsing(self):
+        """Test the GraphQL node mapping directly, without Streamlit or HTTP mocks."""
+        from app import _graphql_node_to_repo
+        repo = _graphql_node_to_repo({
+            "databaseId": 7,
+            "name": "bare-tool",
+            "stargazerCount": 60,
+            "pushedAt": "2024-05-01T00:00:00Z",
+            "createdAt": "2020-02-02T00:00:00Z",
+            "url": "https://github.com/test/bare-tool",
+            "forkCount": 0,
+            "issues": {"totalCount": 0},
+            "pullRequests": {"totalCount": 0},
+            "primaryLanguage": None,
+            "licenseInfo": None,
+            "description": None,
+            "repositoryTopics": {"nodes": []},
+        })
+
+        self.assertIsNone(repo["language"])
+        self.assertIsNone(repo["license"])
+        self.assertIsNone(repo["description"])
+        self.assertEqual(repo["topics"], [])
+        self.assertEqual(repo["open_issues"], 0)
+
+        print("[OK] GraphQL nodes without optional fields map to REST nulls")
+
+    @unittest.skipUnless(os.environ.get("LIVE_GITHUB_TESTS"), "set LIVE_GITHUB_TESTS=1 to query the real GitHub API")
+    def test_live_api_call(self):
+        """Test a real one-page search; the response is kept in cache/ and replayed by later runs."""
+        import repo_cache
+        with patch.object(repo_cache, 'CACHE_DIR', os.path.join(PROJECT_ROOT, "cache")):
+            repos, data_from_live_api = fetch_uml_repos(max_pages=1, cache_ttl=repo_cache.DEFAULT_TTL_SECONDS)
+
+        self.assertTrue(data_from_live_api, "GitHub API should answer the search")
+        self.assertGreater(len(repos), 0, "Should return repositories")
+        self.assertTrue(
+            {"name", "stargazers_count", "pushed_at", "html_url", "topics"}.issubset(repos[0]),
+            "Live results should have the fields the dashboard uses"
+        )
+
+        print(f"[OK] Live GitHub API returned {len(repos)} repositories")
+
+
+class TestKeywordMatching(unittest.TestCase):
+    """Test the single-scan keyword matcher behind the category analyses."""
+
+    def categories(self, description="", name="tool", topics=()):
+        """Categories build_keyword_frame assigns to one repo."""
+        from keyword_analysis import KEYWORD_SETS, build_keyword_frame
+        frame = build_keyword_frame([{"name": name, "description": description, "topics": list(topics)}])
+        return {category for category in KEYWORD_SETS if frame[f"_is_{category}"].iloc[0]}
+
+    def test_ai_needs_a_separate_word(self):
+        """Test that "ai" inside other words is ignored while " ai " and " ai-" match."""
+        self.assertEqual(self.categories("Easy to maintain, with email export"), set())
+        self.assertEqual(self.categories("An ai-based UML editor"), {"ai"})
+        self.assertEqual(self.categories("UML with ai inside"), {"ai"})
+        self.assertEqual(self.categories(topics=["AI"]), {"ai"})
+        self.assertEqual(self.categories(topics=["ai-tools"]), set(), "Topics must match exactly")
+
+    def test_overlapping_keywords(self):
+        """Test that keywords sharing text or position are all found."""
+        self.assertEqual(self.categories("A plant uml editor"), {"plantuml"})
+        self.assertEqual(self.categories("Render plantuml diagrams"), {"plantuml"})
+        self.assertEqual(self.categories(name="plantuml-server"), {"plantuml"})
+        self.assertEqual(self.categories("A no-code and low-code modeler"), {"nocode", "lowcode"})
+        self.assertEqual(self.categories("Nocode ai-assisted plant-uml"), {"nocode", "ai", "plantuml"})
+
+    def test_no_match_across_description_and_name(self):
+        """Test that a keyword split between the end of the description and the name is not found."""
+        self.assertEqual(self.categories("Diagrams for plant", name="uml-viewer"), set())
+        self.assertEqual(self.categories("Visual low", name="code-gen"), set())
+
+        print("[OK] Keyword matching finds whole keywords in each field")
+
+    def test_fingerprint_tracks_matched_text(self):
+        """Test that an edited description or topic list changes the analysis cache key."""
+        from keyword_analysis import repos_fingerprint
+        repo = {"html_url": "https://github.com/test/tool", "pushed_at": "2024-01-01T00:00:00Z",
+                "stargazers_count": 60, "name": "tool", "description": "UML editor", "topics": ["uml"]}
+
+        self.assertNotEqual(repos_fingerprint([repo]), repos_fingerprint([dict(repo, description="AI UML editor")]))
+        self.assertNotEqual(repos_fingerprint([repo]), repos_fingerprint([dict(repo, topics=["uml", "ai"])]))
+
 
 class TestDependencies(unittest.TestCase):
     """Test required dependencies availability."""
@@ -178,12 +514,13 @@ class TestDependencies(unittest.TestCase):
             'plotly': 'Required for charts'
         }
         
+        # Modules app.py already imported are in sys.modules; for the others, find_spec only
+        # locates the module and does not run its (heavy) import code
         missing_modules = []
         for module, purpose in optional_modules.items():
-            try:
-                __import__(module)
+            if module in sys.modules or importlib.util.find_spec(module) is not None:
                 print(f"[OK] {module} is available")
-            except ImportError:
+            else:
                 missing_modules.append(f"{module} ({purpose})")
         
         if missing_modules:
@@ -202,23 +539,21 @@ def run_integration_test():
     try:
         # Test basic file structure
         required_files = ['app.py', 'keyword_analysis.py', 'snapshots/snapshot-2025-06-06.csv']
-        for file in required_files:
-            if not os.path.exists(file):
-                raise FileNotFoundError(f"Required file {file} not found")
+        missing = _missing_files(required_files)
+        if missing:
+            raise FileNotFoundError(f"Required file {missing[0]} not found")
         
         # Test CSV loading
-        with open('snapshots/snapshot-2025-06-06.csv', 'r', encoding='utf-8-sig') as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
-            if len(rows) == 0:
-                raise ValueError("No data in bundled snapshot CSV")
+        df = _load_snapshot(SNAPSHOT_PATH, os.path.getmtime(SNAPSHOT_PATH))
+        if len(df) == 0:
+            raise ValueError("No data in bundled snapshot CSV")
         
         # Test function import
         from app import fetch_uml_repos
         if not callable(fetch_uml_repos):
             raise ImportError("fetch_uml_repos is not callable")
         
-        print(f"[OK] Found {len(rows)} repositories in snapshot")
+        print(f"[OK] Found {len(df)} repositories in snapshot")
         print("[OK] All core functionality verified")
         print("\n[SUCCESS] INTEGRATION TEST PASSED!")
         print("Normal operation is working correctly.")
@@ -230,13 +565,13 @@ def run_integration_test():
 
 
 if __name__ == "__main__":
-    # Run integration test first
-    if run_integration_test():
-        print("\n" + "="*60)
-        print("RUNNING UNIT TESTS")
-        print("="*60)
-        
-        unittest.main(verbosity=2, exit=False, buffer=True)
-    else:
+    # The unit tests repeat the integration checks, so the integration pass only runs on request
+    if os.environ.get("RUN_INTEGRATION") and not run_integration_test():
         print("Integration test failed. Please check your setup.")
-        sys.exit(1) 
\ No newline at end of file
+        sys.exit(1)
+
+    print("\n" + "="*60)
+    print("RUNNING UNIT TESTS")
+    print("="*60)
+    
+    unittest.main(verbosity=2, exit=False, buffer=True)